@@ -0,0 +1,9 @@
+import multiprocessing
+import os
+
+bind = '0.0.0.0:8000'
+# run.Config sizes each worker's database pool from the same WEB_CONCURRENCY value
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gevent'
+worker_connections = 1000
+keepalive = 650